@@ -5,9 +5,334 @@ Handles headers, footers, and custom text elements with comprehensive styling op
 
 from PIL import Image, ImageDraw, ImageFont, ImageColor
 from typing import Dict, Any, List, Tuple, Optional
+from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import os
 import platform
+import time
+
+# Cached once at import time - the OS does not change within a process
+_SYSTEM = platform.system().lower()
+
+# Pillow >= 6.2 rasterizes the glyph once and strokes it natively,
+# which is far cheaper than stamping the text at every offset
+try:
+    _SUPPORTS_STROKE = "stroke_width" in ImageDraw.ImageDraw.text.__code__.co_varnames
+except AttributeError:
+    _SUPPORTS_STROKE = False
+
+# Optional JIT acceleration for the legacy outline fallback below.
+# Numba is not a hard dependency - without it the PIL stamping loop
+# is used unchanged.
+try:
+    import numpy as np
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Font family mappings with per-platform candidate lists.
+# Bare filenames are resolved against the bundled fonts directory,
+# absolute paths are probed as-is. Kept at module level so the table
+# is built once instead of on every font load.
+_FONT_PATHS = {
+    "mono": {
+        "linux": [
+            "JetBrains Mono Medium Nerd Font Complete.ttf",
+            "DejaVuSansMono.ttf",
+            "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+            "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
+            "/usr/share/fonts/TTF/DejaVuSansMono.ttf",
+            "/System/Library/Fonts/Monaco.ttf"
+        ],
+        "darwin": [
+            "JetBrains Mono Medium Nerd Font Complete.ttf",
+            "DejaVuSansMono.ttf",
+            "/System/Library/Fonts/Monaco.ttf",
+            "/Library/Fonts/JetBrainsMono-Regular.ttf"
+        ],
+        "windows": [
+            "JetBrains Mono Medium Nerd Font Complete.ttf",
+            "DejaVuSansMono.ttf",
+            "C:/Windows/Fonts/consola.ttf"
+        ]
+    },
+    "sans": {
+        "linux": [
+            "DejaVuSans.ttf",
+            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+            "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+            "/usr/share/fonts/TTF/DejaVuSans.ttf"
+        ],
+        "darwin": [
+            "DejaVuSans.ttf",
+            "/System/Library/Fonts/Helvetica.ttc"
+        ],
+        "windows": [
+            "DejaVuSans.ttf",
+            "C:/Windows/Fonts/arial.ttf"
+        ]
+    },
+    "serif": {
+        "linux": [
+            "DejaVuSerif.ttf",
+            "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf",
+            "/usr/share/fonts/truetype/liberation/LiberationSerif-Regular.ttf"
+        ],
+        "darwin": [
+            "DejaVuSerif.ttf",
+            "/System/Library/Fonts/Times.ttc"
+        ],
+        "windows": [
+            "DejaVuSerif.ttf",
+            "C:/Windows/Fonts/times.ttf"
+        ]
+    },
+    "modern": {
+        "linux": ["DejaVuSans.ttf"],
+        "darwin": ["DejaVuSans.ttf"],
+        "windows": ["DejaVuSans.ttf"]
+    },
+    "classic": {
+        "linux": ["DejaVuSerif.ttf"],
+        "darwin": ["DejaVuSerif.ttf"],
+        "windows": ["DejaVuSerif.ttf"]
+    },
+    "minimal": {
+        "linux": ["DejaVuSans-ExtraLight.ttf"],
+        "darwin": ["DejaVuSans-ExtraLight.ttf"],
+        "windows": ["DejaVuSans-ExtraLight.ttf"]
+    }
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_font_path(fonts_dir: str, family: str, system: str) -> Optional[str]:
+    """
+    Resolve a font family to the first existing font file path.
+
+    Cached so the os.path.exists probing happens at most once per
+    (fonts_dir, family, system) combination for the process lifetime.
+
+    Args:
+        fonts_dir: Bundled fonts directory
+        family: Font family (mono, sans, serif, modern, classic, minimal)
+        system: Lowercased platform name (linux, darwin, windows)
+
+    Returns:
+        Path to an existing font file, or None if nothing was found
+    """
+    candidates = _FONT_PATHS.get(family, _FONT_PATHS["mono"])
+    font_list = candidates.get(system, candidates["linux"])
+
+    for font_path in font_list:
+        if not os.path.isabs(font_path):
+            font_path = os.path.join(fonts_dir, font_path)
+        try:
+            if os.path.exists(font_path):
+                return font_path
+        except (OSError, IOError):
+            continue
+
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _resolved_font_table(fonts_dir: str, system: str) -> Dict[str, Optional[str]]:
+    """
+    Resolve every font family to its first existing file in one sweep.
+
+    The filesystem is treated as static within a process, so the whole
+    family -> path table is built once per fonts directory and every
+    later font load becomes a plain dict lookup with no stat syscalls.
+
+    Args:
+        fonts_dir: Bundled fonts directory
+        system: Lowercased platform name (linux, darwin, windows)
+
+    Returns:
+        Mapping of font family to resolved path (or None)
+    """
+    return {family: _resolve_font_path(fonts_dir, family, system)
+            for family in _FONT_PATHS}
+
+
+@functools.lru_cache(maxsize=256)
+def _getrgb(color: str):
+    """
+    Cached ImageColor.getrgb - color strings form a tiny bounded set,
+    so each distinct value is only ever parsed once per process.
+
+    Args:
+        color: Hex string or named color
+
+    Returns:
+        Parsed RGB(A) tuple
+    """
+    return ImageColor.getrgb(color)
+
+
+@functools.lru_cache(maxsize=256)
+def _to_rgba(color, opacity: int = 255) -> Tuple[int, int, int, int]:
+    """
+    Parse a color into an (r, g, b, a) tuple, cached per input.
+
+    Args:
+        color: Hex string, named color, or an already-parsed tuple
+        opacity: Alpha applied when the color itself carries none
+
+    Returns:
+        RGBA tuple
+    """
+    if isinstance(color, str):
+        try:
+            parsed = _getrgb(color)
+        except ValueError:
+            parsed = (0, 0, 0)
+    elif isinstance(color, tuple):
+        parsed = color
+    else:
+        parsed = (0, 0, 0)
+
+    if len(parsed) >= 4:
+        return parsed
+    return (*parsed, opacity)
+
+
+def _alpha_of(color) -> int:
+    """
+    Alpha channel of a color, 255 when it carries none.
+
+    Args:
+        color: Hex string, named color, or an already-parsed tuple
+
+    Returns:
+        Alpha value in the 0-255 range
+    """
+    if isinstance(color, list):
+        color = tuple(color)
+    return _to_rgba(color)[3]
+
+
+# Formatted timestamp cache: (format, minute) -> string. The displayed
+# formats have minute resolution, so re-formatting within the same
+# minute (burst captures, multiple elements) would produce the same text
+_time_cache: Dict[Tuple[str, int], str] = {}
+
+
+def _format_time(fmt: str) -> str:
+    """
+    Format the current time, caching the result per (format, minute).
+
+    Args:
+        fmt: strftime format string
+
+    Returns:
+        Formatted timestamp string
+    """
+    minute = int(time.time() // 60)
+    key = (fmt, minute)
+    cached = _time_cache.get(key)
+    if cached is None:
+        # Drop stale entries once the minute rolls over so the cache
+        # never grows past the formats currently in use
+        if _time_cache and next(iter(_time_cache))[1] != minute:
+            _time_cache.clear()
+        cached = _time_cache[key] = datetime.now().strftime(fmt)
+    return cached
+
+
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _stamp_outline(dst, mask, x, y, offsets, color):
+        """
+        Composite a glyph-mask outline onto an RGBA ndarray in one pass.
+
+        The outline alpha at each pixel is the maximum of the glyph mask
+        over every (dx, dy) offset, computed per output pixel so each
+        scanline is independent and prange stays race-free.
+
+        Args:
+            dst: Target RGBA image as a (H, W, 4) uint8 ndarray
+            mask: Glyph alpha mask as a (h, w) uint8 ndarray
+            x: X coordinate of the glyph origin in dst
+            y: Y coordinate of the glyph origin in dst
+            offsets: (N, 2) int64 array of non-zero (dx, dy) pairs
+            color: Outline color as a length-3 float64 array
+        """
+        mask_h, mask_w = mask.shape
+        dst_h = dst.shape[0]
+        dst_w = dst.shape[1]
+
+        # Widest offset in any direction bounds the dilated mask
+        reach = 0
+        for k in range(offsets.shape[0]):
+            if abs(offsets[k, 0]) > reach:
+                reach = abs(offsets[k, 0])
+            if abs(offsets[k, 1]) > reach:
+                reach = abs(offsets[k, 1])
+
+        for i in prange(mask_h + 2 * reach):
+            row = y - reach + i
+            if row < 0 or row >= dst_h:
+                continue
+            for j in range(mask_w + 2 * reach):
+                col = x - reach + j
+                if col < 0 or col >= dst_w:
+                    continue
+
+                # Dilate: strongest mask coverage across all offsets
+                coverage = 0
+                for k in range(offsets.shape[0]):
+                    src_i = i - reach - offsets[k, 1]
+                    src_j = j - reach - offsets[k, 0]
+                    if 0 <= src_i < mask_h and 0 <= src_j < mask_w:
+                        if mask[src_i, src_j] > coverage:
+                            coverage = mask[src_i, src_j]
+                if coverage == 0:
+                    continue
+
+                alpha = coverage / 255.0
+                for c in range(3):
+                    dst[row, col, c] = int(dst[row, col, c] * (1.0 - alpha) + color[c] * alpha + 0.5)
+                dst[row, col, 3] = int(dst[row, col, 3] + alpha * (255 - dst[row, col, 3]) + 0.5)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_truetype(font_path: str, size: int):
+    """
+    Load a TrueType font, caching the parsed font object per (path, size).
+
+    Args:
+        font_path: Path to the font file
+        size: Font size in pixels
+
+    Returns:
+        PIL ImageFont object
+    """
+    return ImageFont.truetype(font_path, size)
+
+
+@dataclass(frozen=True)
+class TextSpec:
+    """
+    Fully resolved rendering spec for one text element.
+
+    Built once at init time: fonts loaded, colors resolved and line
+    ordering decided up front, so the render path only measures,
+    clamps and draws.
+    """
+    text: str
+    position: str
+    font: Any
+    config: Dict[str, Any]
+    show_time: bool = False
+    time_format: str = "%a %d.%b.%Y %H:%M"
+    time_font: Any = None
+    time_first: bool = False
+    offset: Tuple[int, int] = (0, 0)
 
 
 class TextRenderer:
@@ -15,7 +340,55 @@ class TextRenderer:
     Advanced text rendering system with comprehensive styling and positioning options.
     Supports headers, footers, shadows, outlines, backgrounds, and multiple custom elements.
     """
-    
+
+    # Position mappings for more comprehensive placement options.
+    # Class-level so the table is shared by every instance instead of
+    # being rebuilt per renderer.
+    POSITION_MAPPINGS = {
+        # Header positions
+        "top": "top-center",
+        "top-left": "top-left",
+        "top-right": "top-right",
+        "top-center": "top-center",
+
+        # Footer positions
+        "bottom": "bottom-center",
+        "bottom-left": "bottom-left",
+        "bottom-right": "bottom-right",
+        "bottom-center": "bottom-center",
+
+        # Center positions
+        "center": "center-center",
+        "center-left": "center-left",
+        "center-right": "center-right",
+
+        # Legacy compatibility
+        "center-center": "center-center"
+    }
+
+    # Font style mappings, shared across instances as well
+    FONT_STYLES = {
+        "normal": {"weight": "normal", "style": "normal"},
+        "bold": {"weight": "bold", "style": "normal"},
+        "italic": {"weight": "normal", "style": "italic"},
+        "bold-italic": {"weight": "bold", "style": "italic"}
+    }
+
+    # Normalized position -> (vertical, horizontal) anchor indices,
+    # where 0 = start, 1 = middle, 2 = end. Lets positioning use O(1)
+    # table lookups instead of repeated substring checks.
+    _ANCHORS = {
+        "top-left": (0, 0),
+        "top-center": (0, 1),
+        "top-right": (0, 2),
+        "center-left": (1, 0),
+        "center-center": (1, 1),
+        "center-right": (1, 2),
+        "bottom-left": (2, 0),
+        "bottom-center": (2, 1),
+        "bottom-right": (2, 2),
+    }
+
     def __init__(self, config: Dict[str, Any], theme_data: Dict[str, Any]):
         """
         Initialize the text renderer.
@@ -26,38 +399,169 @@ class TextRenderer:
         """
         self.config = config
         self.theme_data = theme_data
-        
-        # Position mappings for more comprehensive placement options
-        self.position_mappings = {
-            # Header positions
-            "top": "top-center",
-            "top-left": "top-left", 
-            "top-right": "top-right",
-            "top-center": "top-center",
-            
-            # Footer positions
-            "bottom": "bottom-center",
-            "bottom-left": "bottom-left",
-            "bottom-right": "bottom-right", 
-            "bottom-center": "bottom-center",
-            
-            # Center positions
-            "center": "center-center",
-            "center-left": "center-left",
-            "center-right": "center-right",
-            
-            # Legacy compatibility
-            "center-center": "center-center"
-        }
-        
-        # Font style mappings
-        self.font_styles = {
-            "normal": {"weight": "normal", "style": "normal"},
-            "bold": {"weight": "bold", "style": "normal"},
-            "italic": {"weight": "normal", "style": "italic"},
-            "bold-italic": {"weight": "bold", "style": "italic"}
-        }
-    
+
+        # Resolve the bundled fonts directory once; font loading below
+        # caches on top of this so repeated renders skip the probing
+        self.fonts_dir = self._get_fonts_directory()
+
+        # Resolve enabled flags once so hot capture loops don't re-walk
+        # the nested config dicts on every render
+        self._refresh_enabled_flags()
+
+    def _refresh_enabled_flags(self) -> None:
+        """
+        Precompute enabled flags and frozen render specs from the config.
+
+        Called from __init__; call again if the config dict is mutated
+        after construction.
+        """
+        header_config = self.config.get("header", {})
+        footer_config = self.config.get("footer", {})
+
+        self._header_enabled = header_config.get("enabled", False)
+        self._footer_enabled = footer_config.get("enabled", False)
+        self._header_custom = header_config.get("custom_elements", [])
+        self._footer_custom = footer_config.get("custom_elements", [])
+
+        # Render-time configs with theme colors applied and color strings
+        # pre-parsed to RGBA tuples, so draws skip both the per-render
+        # config copy and the hex parsing
+        self._header_render_config = self._prepare_render_config(header_config, "header_fg")
+        self._footer_render_config = self._prepare_render_config(footer_config, "footer_fg")
+
+        # Frozen specs with fonts pre-loaded and line ordering decided,
+        # leaving the render methods with nothing to parse.
+        # Header: time goes below the text when anchored at the top;
+        # footer: time goes above the text when anchored at the bottom.
+        self._header_spec = self._build_block_spec(
+            header_config, self._header_render_config,
+            default_family="sans", default_size=22, default_time_size=18,
+            default_text="XShot Screenshot", default_position="top",
+            time_first_anchors=(1, 2)
+        ) if self._header_enabled else None
+
+        self._footer_spec = self._build_block_spec(
+            footer_config, self._footer_render_config,
+            default_family="mono", default_size=20, default_time_size=15,
+            default_text="Shot by XShot", default_position="bottom",
+            time_first_anchors=(2,)
+        ) if self._footer_enabled else None
+
+        # Custom element specs, in render order (footer first)
+        self._custom_specs = []
+        for element in self._footer_custom + self._header_custom:
+            if not element.get("enabled", True):
+                continue
+            offset = element.get("offset", [0, 0])
+            self._custom_specs.append(TextSpec(
+                text=element.get("text", "Custom Text"),
+                position=element.get("position", "center"),
+                font=self._load_font(element.get("font_family", "mono"),
+                                     element.get("size", 16),
+                                     element.get("font_style", "normal")),
+                config=element,
+                offset=(offset[0], offset[1])
+            ))
+        self._has_custom = bool(self._custom_specs)
+
+        # Whether any enabled element will actually alpha-blend a
+        # translucent background - decides the single up-front RGBA
+        # conversion in render_all_text
+        active_configs = []
+        if self._header_enabled:
+            active_configs.append(self._header_render_config)
+        if self._footer_enabled:
+            active_configs.append(self._footer_render_config)
+        active_configs.extend(element for element in self._header_custom + self._footer_custom
+                              if element.get("enabled", True))
+
+        self._needs_alpha = False
+        for cfg in active_configs:
+            if not cfg.get("background_enabled", False):
+                continue
+            bg_color = cfg.get("background_color", "#000000")
+            if isinstance(bg_color, list):
+                bg_color = tuple(bg_color)
+            if _to_rgba(bg_color, cfg.get("background_opacity", 128))[3] < 255:
+                self._needs_alpha = True
+                break
+
+    def _prepare_render_config(self, config: Dict[str, Any], theme_key: str) -> Dict[str, Any]:
+        """
+        Copy a header/footer config with all colors resolved to RGBA tuples.
+
+        Args:
+            config: Header or footer configuration dictionary
+            theme_key: Theme color key for the text color
+
+        Returns:
+            Config copy with pre-parsed color values
+        """
+        prepared = config.copy()
+        prepared["color"] = _to_rgba(self._get_color_from_theme(theme_key))
+
+        for key, default in (("shadow_color", "#FFFFFF"),
+                             ("outline_color", "#FFFFFF"),
+                             ("border_color", "#FFFFFF")):
+            color = prepared.get(key, default)
+            prepared[key] = _to_rgba(tuple(color) if isinstance(color, list) else color)
+
+        # Background opacity is baked into the background color up front
+        bg_color = prepared.get("background_color", "#000000")
+        prepared["background_color"] = _to_rgba(
+            tuple(bg_color) if isinstance(bg_color, list) else bg_color,
+            prepared.get("background_opacity", 128)
+        )
+
+        return prepared
+
+    def _build_block_spec(self, config: Dict[str, Any],
+                         render_config: Dict[str, Any], default_family: str,
+                         default_size: int, default_time_size: int,
+                         default_text: str, default_position: str,
+                         time_first_anchors: Tuple[int, ...]) -> TextSpec:
+        """
+        Build the frozen spec for a header or footer block.
+
+        Args:
+            config: Raw header or footer configuration
+            render_config: Prepared config with resolved colors
+            default_family: Font family when none is configured
+            default_size: Text size when none is configured
+            default_time_size: Timestamp size when none is configured
+            default_text: Text when none is configured
+            default_position: Position when none is configured
+            time_first_anchors: Vertical anchor indices for which the
+                timestamp line renders above the main text
+
+        Returns:
+            TextSpec for the block
+        """
+        font_family = config.get("font_family", default_family)
+        font_style = config.get("font_style", "normal")
+        position = config.get("position", default_position)
+        show_time = config.get("show_time", False)
+
+        time_font = None
+        time_first = False
+        if show_time:
+            time_font = self._load_font(font_family,
+                                        config.get("time_size", default_time_size),
+                                        font_style)
+            normalized_pos = self.POSITION_MAPPINGS.get(position, "bottom-center")
+            time_first = self._ANCHORS[normalized_pos][0] in time_first_anchors
+
+        return TextSpec(
+            text=config.get("text", default_text),
+            position=position,
+            font=self._load_font(font_family, config.get("size", default_size), font_style),
+            config=render_config,
+            show_time=show_time,
+            time_format=config.get("time_format", "%a %d.%b.%Y %H:%M"),
+            time_font=time_font,
+            time_first=time_first
+        )
+
     def _get_fonts_directory(self) -> str:
         """
         Get fonts directory with enhanced cross-platform support.
@@ -107,102 +611,92 @@ class TextRenderer:
             PIL ImageFont object
         """
         try:
-            system = platform.system().lower()
-            style_info = self.font_styles.get(style, self.font_styles["normal"])
-            
-            # Get the proper fonts directory
-            fonts_dir = self._get_fonts_directory()
-            
-            # Enhanced font family mappings with style support
-            font_paths = {
-                "mono": {
-                    "linux": [
-                        os.path.join(fonts_dir, "JetBrains Mono Medium Nerd Font Complete.ttf"),
-                        os.path.join(fonts_dir, "DejaVuSansMono.ttf"),
-                        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
-                        "/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
-                        "/usr/share/fonts/TTF/DejaVuSansMono.ttf",
-                        "/System/Library/Fonts/Monaco.ttf"
-                    ],
-                    "darwin": [
-                        os.path.join(fonts_dir, "JetBrains Mono Medium Nerd Font Complete.ttf"),
-                        os.path.join(fonts_dir, "DejaVuSansMono.ttf"),
-                        "/System/Library/Fonts/Monaco.ttf",
-                        "/Library/Fonts/JetBrainsMono-Regular.ttf"
-                    ],
-                    "windows": [
-                        os.path.join(fonts_dir, "JetBrains Mono Medium Nerd Font Complete.ttf"),
-                        os.path.join(fonts_dir, "DejaVuSansMono.ttf"),
-                        "C:/Windows/Fonts/consola.ttf"
-                    ]
-                },
-                "sans": {
-                    "linux": [
-                        os.path.join(fonts_dir, "DejaVuSans.ttf"),
-                        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf", 
-                        "/usr/share/fonts/TTF/DejaVuSans.ttf"
-                    ],
-                    "darwin": [
-                        os.path.join(fonts_dir, "DejaVuSans.ttf"),
-                        "/System/Library/Fonts/Helvetica.ttc"
-                    ],
-                    "windows": [
-                        os.path.join(fonts_dir, "DejaVuSans.ttf"),
-                        "C:/Windows/Fonts/arial.ttf"
-                    ]
-                },
-                "serif": {
-                    "linux": [
-                        os.path.join(fonts_dir, "DejaVuSerif.ttf"),
-                        "/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf",
-                        "/usr/share/fonts/truetype/liberation/LiberationSerif-Regular.ttf"
-                    ],
-                    "darwin": [
-                        os.path.join(fonts_dir, "DejaVuSerif.ttf"),
-                        "/System/Library/Fonts/Times.ttc"
-                    ],
-                    "windows": [
-                        os.path.join(fonts_dir, "DejaVuSerif.ttf"),
-                        "C:/Windows/Fonts/times.ttf"
-                    ]
-                },
-                "modern": {
-                    "linux": [os.path.join(fonts_dir, "DejaVuSans.ttf")],
-                    "darwin": [os.path.join(fonts_dir, "DejaVuSans.ttf")],
-                    "windows": [os.path.join(fonts_dir, "DejaVuSans.ttf")]
-                },
-                "classic": {
-                    "linux": [os.path.join(fonts_dir, "DejaVuSerif.ttf")],
-                    "darwin": [os.path.join(fonts_dir, "DejaVuSerif.ttf")],
-                    "windows": [os.path.join(fonts_dir, "DejaVuSerif.ttf")]
-                },
-                "minimal": {
-                    "linux": [os.path.join(fonts_dir, "DejaVuSans-ExtraLight.ttf")],
-                    "darwin": [os.path.join(fonts_dir, "DejaVuSans-ExtraLight.ttf")],
-                    "windows": [os.path.join(fonts_dir, "DejaVuSans-ExtraLight.ttf")]
-                }
-            }
-            
-            # Try to load fonts for the specified family and style
-            font_list = font_paths.get(family, font_paths["mono"]).get(system, font_paths["mono"]["linux"])
-            
-            for font_path in font_list:
+            style_info = self.FONT_STYLES.get(style, self.FONT_STYLES["normal"])
+
+            # Every family is resolved in one up-front sweep; unknown or
+            # unresolvable families fall back to mono like before
+            table = _resolved_font_table(self.fonts_dir, _SYSTEM)
+            font_path = table.get(family) or table.get("mono")
+            if font_path:
                 try:
-                    # Check if font file exists
-                    if os.path.exists(font_path):
-                        return ImageFont.truetype(font_path, size)
+                    return _load_truetype(font_path, size)
                 except (OSError, IOError):
-                    continue
-            
+                    pass
+
             # Fallback to system default
             return ImageFont.load_default()
-            
+
         except Exception:
             # Ultimate fallback
             return ImageFont.load_default()
     
-    def _get_text_position(self, text: str, font, 
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _measure(font, text: str) -> Tuple[int, int]:
+        """
+        Measure text dimensions for a given font, memoized per (font, text).
+
+        Headers, footers and timestamps are measured from several call
+        sites per render and repeat across screenshots, so caching the
+        bbox lookup collapses the redundant work. The cache stays bounded
+        because font objects themselves are cached per (path, size).
+
+        Args:
+            font: Font object
+            text: Text to measure
+
+        Returns:
+            Tuple of (width, height) in pixels
+        """
+        bbox = font.getbbox(text)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _ink_extents(font, text: str) -> Tuple[int, int]:
+        """
+        Right and bottom ink extents of text drawn at origin (0, 0),
+        memoized per (font, text).
+
+        Unlike _measure this keeps the glyph offsets, so it bounds the
+        area a draw.text call can actually touch.
+
+        Args:
+            font: Font object
+            text: Text to measure
+
+        Returns:
+            Tuple of (right, bottom) extents in pixels
+        """
+        bbox = font.getbbox(text)
+        return bbox[2], bbox[3]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _text_size(font, text: str) -> Tuple[int, int]:
+        """
+        Fast text dimensions for positioning, memoized per (font, text).
+
+        getlength only advances the pen without rasterizing glyph extents,
+        and the line height comes straight from the font size - enough for
+        placement and clamping. _measure keeps the exact bbox for the
+        effect tiles where glyph extents matter.
+
+        Args:
+            font: Font object
+            text: Text to measure
+
+        Returns:
+            Tuple of (width, height) in pixels
+        """
+        try:
+            return int(font.getlength(text)), font.size
+        except AttributeError:
+            # Bitmap fallback fonts carry no size attribute
+            bbox = font.getbbox(text)
+            return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+    def _get_text_position(self, text: str, font,
                           position: str, img_width: int, img_height: int, 
                           padding: int = 20) -> Tuple[int, int]:
         """
@@ -219,29 +713,37 @@ class TextRenderer:
         Returns:
             Tuple of (x, y) coordinates
         """
-        # Get text dimensions
-        bbox = font.getbbox(text)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        
-        # Normalize position
-        normalized_pos = self.position_mappings.get(position, "bottom-center")
-        
-        # Calculate coordinates based on position
-        if "top" in normalized_pos:
-            y = padding
-        elif "bottom" in normalized_pos:
-            y = img_height - text_height - padding
-        else:  # center
-            y = (img_height - text_height) // 2
-        
-        if "left" in normalized_pos:
-            x = padding
-        elif "right" in normalized_pos:
-            x = img_width - text_width - padding
-        else:  # center
-            x = (img_width - text_width) // 2
-        
+        # Get text dimensions (pen-advance metrics are enough here)
+        text_width, text_height = self._text_size(font, text)
+
+        return self._anchor_position(text_width, text_height, position,
+                                     img_width, img_height, padding)
+
+    def _anchor_position(self, width: int, height: int, position: str,
+                        img_width: int, img_height: int,
+                        padding: int = 20) -> Tuple[int, int]:
+        """
+        Anchor a box of the given size inside the image.
+
+        Args:
+            width: Box width
+            height: Box height
+            position: Position string (e.g., "top-left", "bottom-center")
+            img_width: Image width
+            img_height: Image height
+            padding: Padding from edges
+
+        Returns:
+            Tuple of (x, y) coordinates
+        """
+        # Normalize position and look up its anchor indices
+        normalized_pos = self.POSITION_MAPPINGS.get(position, "bottom-center")
+        vy, vx = self._ANCHORS[normalized_pos]
+
+        # Index into start/middle/end coordinate tables
+        y = (padding, (img_height - height) // 2, img_height - height - padding)[vy]
+        x = (padding, (img_width - width) // 2, img_width - width - padding)[vx]
+
         return x, y
     
     def _get_color_from_theme(self, key: str) -> str:
@@ -272,47 +774,253 @@ class TextRenderer:
         
         return ui.get(key) or colors.get(key) or defaults.get(key, "#000000")
     
-    def _apply_text_effects(self, draw, text: str, position: Tuple[int, int],
-                           font, config: Dict[str, Any]) -> None:
+    def _apply_text_effects(self, img: Image.Image, draw, text: str,
+                           position: Tuple[int, int], font,
+                           config: Dict[str, Any],
+                           with_background: bool = True) -> None:
         """
         Apply advanced text effects like shadows, outlines, and backgrounds.
-        
+
+        Plain text is drawn straight onto the image. Effects are drawn
+        directly too as long as they are opaque; only a translucent
+        background routes everything through an offscreen RGBA tile that
+        is composited onto the image in a single blend pass.
+
         Args:
-            draw: PIL ImageDraw object
+            img: PIL Image object being rendered onto
+            draw: PIL ImageDraw object for the image
             text: Text to render
             position: Text position (x, y)
             font: Font object
             config: Text configuration
+            with_background: Whether this call draws the background
+                (False when the caller drew a shared block background)
         """
         x, y = position
-        
+        text_color = config.get("color", "#000000")
+
+        has_background = with_background and config.get("background_enabled", False)
+        has_shadow = config.get("text_shadow", False)
+        has_outline = config.get("text_outline", False)
+
+        # Drop layers that cannot produce visible pixels before any
+        # rasterization happens: fully transparent colors, zero-width
+        # outlines, and shadows hidden exactly behind the text
+        shadow_offset = config.get("shadow_offset", [2, 2]) if has_shadow else [0, 0]
+        if has_shadow:
+            if (shadow_offset[0] == 0 and shadow_offset[1] == 0) or \
+                    _alpha_of(config.get("shadow_color", "#FFFFFF")) == 0:
+                has_shadow = False
+                shadow_offset = [0, 0]
+
+        outline_width = config.get("outline_width", 1) if has_outline else 0
+        if has_outline:
+            if outline_width <= 0 or _alpha_of(config.get("outline_color", "#FFFFFF")) == 0:
+                has_outline = False
+                outline_width = 0
+
+        bg_rgba = None
+        if has_background:
+            bg_color = config.get("background_color", "#000000")
+            if isinstance(bg_color, list):
+                bg_color = tuple(bg_color)
+            bg_rgba = _to_rgba(bg_color, config.get("background_opacity", 128))
+            if bg_rgba[3] == 0:
+                has_background = False
+
+        # Fast path: no effects means no tile is needed
+        if not (has_background or has_shadow or has_outline):
+            draw.text((x, y), text, fill=text_color, font=font)
+            return
+
+        # Only a translucent background needs the offscreen tile; opaque
+        # layers can go straight onto the shared draw without blending
+        tile = None
+        target_draw = draw
+        origin = (x, y)
+        if has_background:
+            if bg_rgba[3] < 255:
+                bg_padding = config.get("background_padding", [10, 5])
+                border_width = config.get("border_width", 1) if config.get("background_border", False) else 0
+
+                # Uniform margin big enough to hold every enabled effect
+                pad = max(bg_padding[0], bg_padding[1],
+                          abs(shadow_offset[0]), abs(shadow_offset[1]),
+                          outline_width) + border_width
+
+                # Text drawn at (pad, pad) inks out to pad + bbox right/
+                # bottom, so the tile must span the full ink extents -
+                # sizing it from the bbox width/height alone clips
+                # descenders whenever the glyph top offset exceeds pad
+                ink_right, ink_bottom = self._ink_extents(font, text)
+                tile = Image.new("RGBA", (ink_right + 2 * pad, ink_bottom + 2 * pad), (0, 0, 0, 0))
+                target_draw = ImageDraw.Draw(tile)
+                origin = (pad, pad)
+
         # Draw background if enabled
-        if config.get("background_enabled", False):
-            self._draw_text_background(draw, text, position, font, config)
-        
+        if has_background:
+            self._draw_text_background(target_draw, text, origin, font, config)
+
         # Draw text shadow if enabled
-        if config.get("text_shadow", False):
-            shadow_offset = config.get("shadow_offset", [2, 2])
+        if has_shadow:
             shadow_color = config.get("shadow_color", "#FFFFFF")
-            shadow_x = x + shadow_offset[0]
-            shadow_y = y + shadow_offset[1]
-            draw.text((shadow_x, shadow_y), text, fill=shadow_color, font=font)
-        
-        # Draw text outline if enabled
-        if config.get("text_outline", False):
+            target_draw.text((origin[0] + shadow_offset[0], origin[1] + shadow_offset[1]),
+                             text, fill=shadow_color, font=font)
+
+        # Draw text, with outline if enabled
+        if has_outline:
             outline_color = config.get("outline_color", "#FFFFFF")
-            outline_width = config.get("outline_width", 1)
-            
-            # Draw outline by drawing text multiple times with offset
-            for dx in range(-outline_width, outline_width + 1):
-                for dy in range(-outline_width, outline_width + 1):
-                    if dx != 0 or dy != 0:
-                        draw.text((x + dx, y + dy), text, fill=outline_color, font=font)
-        
-        # Draw main text
-        text_color = config.get("color", "#000000")
-        draw.text((x, y), text, fill=text_color, font=font)
+
+            if _SUPPORTS_STROKE:
+                # Rasterize once and let Pillow stroke the outline in C
+                target_draw.text(origin, text, fill=text_color, font=font,
+                                 stroke_width=outline_width, stroke_fill=outline_color)
+            else:
+                # Fallback for old Pillow: stamp the outline from a single
+                # glyph rasterization when numba is available, otherwise
+                # draw the text repeatedly with offsets
+                stamped = tile is not None and self._stamp_outline_jit(
+                    tile, text, font, origin[0], outline_width, outline_color)
+                if not stamped:
+                    for dx in range(-outline_width, outline_width + 1):
+                        for dy in range(-outline_width, outline_width + 1):
+                            if dx != 0 or dy != 0:
+                                target_draw.text((origin[0] + dx, origin[1] + dy), text,
+                                                 fill=outline_color, font=font)
+                target_draw.text(origin, text, fill=text_color, font=font)
+        else:
+            target_draw.text(origin, text, fill=text_color, font=font)
+
+        # Single blend pass onto the base image
+        if tile is not None:
+            dest = (x - origin[0], y - origin[1])
+            if img.mode == "RGBA" and dest[0] >= 0 and dest[1] >= 0:
+                img.alpha_composite(tile, dest)
+            else:
+                # paste clips negative coordinates and handles non-RGBA bases
+                img.paste(tile, dest, tile)
     
+    def _render_text_block(self, img: Image.Image, draw,
+                          lines: List[Tuple[str, Any]], position: str,
+                          config: Dict[str, Any]) -> None:
+        """
+        Render one or more lines of text as a single anchored block.
+
+        The lines share one position calculation, one bounds check and -
+        when a background is enabled - one background rectangle around
+        the whole block, instead of running the full pipeline per line.
+
+        Args:
+            img: PIL Image object
+            draw: PIL ImageDraw object for the image
+            lines: (text, font) tuples ordered top to bottom
+            position: Position string (e.g., "top-left", "bottom-center")
+            config: Text configuration shared by all lines
+        """
+        img_width, img_height = img.size
+        padding = 20
+        line_gap = 5
+
+        # Measure every line once and derive the block size
+        sizes = [self._text_size(font, text) for text, font in lines]
+        block_width = max(width for width, _ in sizes)
+        block_height = sum(height for _, height in sizes) + line_gap * (len(lines) - 1)
+
+        # Anchor and clamp the whole block inside the image
+        x, y = self._anchor_position(block_width, block_height, position,
+                                     img_width, img_height, padding)
+        x = min(max(x, padding), max(padding, img_width - block_width - padding))
+        y = min(max(y, padding), max(padding, img_height - block_height - padding))
+
+        # One background pass around the whole block; opaque backgrounds
+        # draw directly, translucent ones blend through a tile
+        if config.get("background_enabled", False):
+            bg_color = config.get("background_color", "#000000")
+            if isinstance(bg_color, list):
+                bg_color = tuple(bg_color)
+            bg_rgba = _to_rgba(bg_color, config.get("background_opacity", 128))
+
+            if bg_rgba[3] == 0:
+                # Fully transparent background draws nothing
+                pass
+            elif bg_rgba[3] >= 255:
+                self._draw_background_rect(draw, x, y, block_width, block_height, config)
+            else:
+                bg_padding = config.get("background_padding", [10, 5])
+                border_width = config.get("border_width", 1) if config.get("background_border", False) else 0
+                pad = max(bg_padding[0], bg_padding[1]) + border_width
+
+                tile = Image.new("RGBA", (block_width + 2 * pad, block_height + 2 * pad), (0, 0, 0, 0))
+                self._draw_background_rect(ImageDraw.Draw(tile), pad, pad,
+                                           block_width, block_height, config)
+
+                dest = (x - pad, y - pad)
+                if img.mode == "RGBA" and dest[0] >= 0 and dest[1] >= 0:
+                    img.alpha_composite(tile, dest)
+                else:
+                    img.paste(tile, dest, tile)
+
+        # Lines align horizontally inside the block by the same anchor
+        normalized_pos = self.POSITION_MAPPINGS.get(position, "bottom-center")
+        hx = self._ANCHORS[normalized_pos][1]
+
+        line_y = y
+        for (text, font), (line_width, line_height) in zip(lines, sizes):
+            line_x = (x, x + (block_width - line_width) // 2, x + block_width - line_width)[hx]
+            self._apply_text_effects(img, draw, text, (line_x, line_y), font,
+                                     config, with_background=False)
+            line_y += line_height + line_gap
+
+    def _stamp_outline_jit(self, tile: Image.Image, text: str, font, pad: int,
+                          outline_width: int, outline_color) -> bool:
+        """
+        Stamp a text outline into the tile via the JIT-compiled compositor.
+
+        Rasterizes the glyphs once to an alpha mask and composites it at
+        every outline offset in one compiled pass, instead of re-drawing
+        the whole string (2*width+1)^2 - 1 times.
+
+        Args:
+            tile: Offscreen RGBA tile being rendered into
+            text: Text to outline
+            font: Font object
+            pad: Tile margin where the text origin sits
+            outline_width: Outline thickness in pixels
+            outline_color: Outline color
+
+        Returns:
+            True if the outline was stamped, False to use the draw loop
+        """
+        if not _HAS_NUMBA:
+            return False
+
+        try:
+            # Single rasterization of the glyphs to an alpha mask
+            mask = font.getmask(text)
+            mask_arr = np.asarray(mask, dtype=np.uint8).reshape(mask.size[1], mask.size[0])
+
+            # draw.text places the mask at the bbox origin offset
+            bbox = font.getbbox(text)
+
+            offsets = np.array(
+                [(dx, dy)
+                 for dx in range(-outline_width, outline_width + 1)
+                 for dy in range(-outline_width, outline_width + 1)
+                 if dx != 0 or dy != 0],
+                dtype=np.int64
+            )
+            color = np.array(_to_rgba(outline_color)[:3], dtype=np.float64)
+
+            dst = np.array(tile, dtype=np.uint8)
+            _stamp_outline(dst, mask_arr, pad + int(bbox[0]), pad + int(bbox[1]),
+                           offsets, color)
+            tile.paste(Image.fromarray(dst, "RGBA"))
+            return True
+
+        except Exception:
+            # Any failure falls back to the plain stamping loop
+            return False
+
     def _draw_text_background(self, draw, text: str, position: Tuple[int, int],
                              font, config: Dict[str, Any]) -> None:
         """
@@ -326,12 +1034,25 @@ class TextRenderer:
             config: Text configuration
         """
         x, y = position
-        
+
         # Get text dimensions
-        bbox = font.getbbox(text)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        
+        text_width, text_height = self._measure(font, text)
+
+        self._draw_background_rect(draw, x, y, text_width, text_height, config)
+
+    def _draw_background_rect(self, draw, x: int, y: int, text_width: int,
+                             text_height: int, config: Dict[str, Any]) -> None:
+        """
+        Draw a background rectangle (and optional border) for a text box.
+
+        Args:
+            draw: PIL ImageDraw object
+            x: X coordinate of the text origin
+            y: Y coordinate of the text origin
+            text_width: Width of the text box
+            text_height: Height of the text box
+            config: Text configuration
+        """
         # Get background settings
         bg_color = config.get("background_color", "#000000")
         bg_opacity = config.get("background_opacity", 128)
@@ -343,14 +1064,11 @@ class TextRenderer:
         bg_x2 = x + text_width + padding[0]
         bg_y2 = y + text_height + padding[1]
         
-        # Convert color with opacity
-        if isinstance(bg_color, str) and bg_color.startswith('#'):
-            # Convert hex to RGBA
-            color_rgb = ImageColor.getrgb(bg_color)
-            bg_color_rgba = (*color_rgb, bg_opacity)
-        else:
-            bg_color_rgba = (*bg_color, bg_opacity) if isinstance(bg_color, tuple) else (0, 0, 0, bg_opacity)
-        
+        # Convert color with opacity (identity for pre-resolved tuples)
+        if isinstance(bg_color, list):
+            bg_color = tuple(bg_color)
+        bg_color_rgba = _to_rgba(bg_color, bg_opacity)
+
         # Draw background rectangle
         draw.rectangle([(bg_x1, bg_y1), (bg_x2, bg_y2)], fill=bg_color_rgba)
         
@@ -358,9 +1076,13 @@ class TextRenderer:
         if config.get("background_border", False):
             border_color = config.get("border_color", "#FFFFFF")
             border_width = config.get("border_width", 1)
-            
-            for i in range(border_width):
-                draw.rectangle([(bg_x1 - i, bg_y1 - i), (bg_x2 + i, bg_y2 + i)], outline=border_color)
+
+            # One rectangle call draws the full border thickness
+            draw.rectangle(
+                [(bg_x1 - border_width + 1, bg_y1 - border_width + 1),
+                 (bg_x2 + border_width - 1, bg_y2 + border_width - 1)],
+                outline=border_color, width=border_width
+            )
     
     def _check_text_bounds(self, x: int, y: int, text: str, font,
                           img_width: int, img_height: int, padding: int = 20) -> Tuple[int, int]:
@@ -379,201 +1101,125 @@ class TextRenderer:
         Returns:
             Adjusted (x, y) coordinates
         """
-        # Get text dimensions
-        bbox = font.getbbox(text)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        
-        # Ensure text doesn't go outside image bounds
-        if x < padding:
-            x = padding
-        elif x + text_width > img_width - padding:
-            x = img_width - text_width - padding
-        
-        if y < padding:
-            y = padding
-        elif y + text_height > img_height - padding:
-            y = img_height - text_height - padding
-        
-        return max(padding, x), max(padding, y)
+        # Get text dimensions (pen-advance metrics are enough here)
+        text_width, text_height = self._text_size(font, text)
+
+        # Clamp into the padded area, preferring the left/top edge when
+        # the text is too large to fit at all
+        return (max(min(x, img_width - text_width - padding), padding),
+                max(min(y, img_height - text_height - padding), padding))
     
-    def render_header(self, img: Image.Image) -> Image.Image:
+    def render_header(self, img: Image.Image, draw=None) -> Image.Image:
         """
         Render header text with advanced styling options.
-        
+
         Args:
             img: PIL Image object
-            
+            draw: Optional shared ImageDraw object for the image
+
         Returns:
             Image with header added
         """
-        if not self.config.get("header", {}).get("enabled", False):
+        spec = self._header_spec
+        if spec is None:
             return img
-        
-        header_config = self.config["header"]
-        width, height = img.size
-        
-        # Create draw object
-        draw = ImageDraw.Draw(img)
-        
-        # Load font with style
-        font_family = header_config.get("font_family", "sans")
-        font_style = header_config.get("font_style", "normal")
-        font_size = header_config.get("size", 22)
-        font = self._load_font(font_family, font_size, font_style)
-        
-        # Get header text
-        header_text = header_config.get("text", "XShot Screenshot")
-        position = header_config.get("position", "top")
-        
-        # Calculate position
-        text_x, text_y = self._get_text_position(header_text, font, position, width, height)
-        
-        # Check bounds
-        text_x, text_y = self._check_text_bounds(text_x, text_y, header_text, font, width, height)
-        
-        # Apply text effects with theme color
-        header_config_with_theme = header_config.copy()
-        header_config_with_theme["color"] = self._get_color_from_theme("header_fg")
-        self._apply_text_effects(draw, header_text, (text_x, text_y), font, header_config_with_theme)
-        
-        # Add timestamp if enabled
-        if header_config.get("show_time", False):
-            time_text = datetime.now().strftime(header_config.get("time_format", "%a %d.%b.%Y %H:%M"))
-            time_font = self._load_font(font_family, header_config.get("time_size", 18), font_style)
-            
-            # Position time text relative to main header
-            time_x, time_y = self._get_text_position(time_text, time_font, position, width, height)
-            if "top" in position:
-                time_y = text_y + font_size + 5
+
+        # Reuse the caller's draw object when rendering a full pass
+        if draw is None:
+            draw = ImageDraw.Draw(img)
+
+        # Everything is pre-resolved in the spec - just assemble the
+        # line list and draw the block
+        lines = [(spec.text, spec.font)]
+        if spec.show_time:
+            time_line = (_format_time(spec.time_format), spec.time_font)
+            if spec.time_first:
+                lines.insert(0, time_line)
             else:
-                time_y = text_y - header_config.get("time_size", 18) - 5
-            
-            time_x, time_y = self._check_text_bounds(time_x, time_y, time_text, time_font, width, height)
-            self._apply_text_effects(draw, time_text, (time_x, time_y), time_font, header_config_with_theme)
-        
+                lines.append(time_line)
+
+        self._render_text_block(img, draw, lines, spec.position, spec.config)
+
         return img
     
-    def render_footer(self, img: Image.Image) -> Image.Image:
+    def render_footer(self, img: Image.Image, draw=None) -> Image.Image:
         """
         Render footer text with advanced styling options.
-        
+
         Args:
             img: PIL Image object
-            
+            draw: Optional shared ImageDraw object for the image
+
         Returns:
             Image with footer added
         """
-        if not self.config.get("footer", {}).get("enabled", False):
+        spec = self._footer_spec
+        if spec is None:
             return img
-        
-        footer_config = self.config["footer"]
-        width, height = img.size
-        
-        # Create draw object
-        draw = ImageDraw.Draw(img)
-        
-        # Load font with style
-        font_family = footer_config.get("font_family", "mono")
-        font_style = footer_config.get("font_style", "normal")
-        font_size = footer_config.get("size", 20)
-        font = self._load_font(font_family, font_size, font_style)
-        
-        # Get footer text
-        footer_text = footer_config.get("text", "Shot by XShot")
-        position = footer_config.get("position", "bottom")
-        
-        # Calculate position
-        text_x, text_y = self._get_text_position(footer_text, font, position, width, height)
-        
-        # Check bounds
-        text_x, text_y = self._check_text_bounds(text_x, text_y, footer_text, font, width, height)
-        
-        # Apply text effects with theme color
-        footer_config_with_theme = footer_config.copy()
-        footer_config_with_theme["color"] = self._get_color_from_theme("footer_fg")
-        self._apply_text_effects(draw, footer_text, (text_x, text_y), font, footer_config_with_theme)
-        
-        # Add timestamp if enabled
-        if footer_config.get("show_time", False):
-            time_text = datetime.now().strftime(footer_config.get("time_format", "%a %d.%b.%Y %H:%M"))
-            time_font = self._load_font(font_family, footer_config.get("time_size", 15), font_style)
-            
-            # Position time text relative to main footer
-            time_x, time_y = self._get_text_position(time_text, time_font, position, width, height)
-            if "bottom" in position:
-                time_y = text_y - footer_config.get("time_size", 15) - 5
+
+        # Reuse the caller's draw object when rendering a full pass
+        if draw is None:
+            draw = ImageDraw.Draw(img)
+
+        # Everything is pre-resolved in the spec - just assemble the
+        # line list and draw the block
+        lines = [(spec.text, spec.font)]
+        if spec.show_time:
+            time_line = (_format_time(spec.time_format), spec.time_font)
+            if spec.time_first:
+                lines.insert(0, time_line)
             else:
-                time_y = text_y + font_size + 5
-            
-            time_x, time_y = self._check_text_bounds(time_x, time_y, time_text, time_font, width, height)
-            self._apply_text_effects(draw, time_text, (time_x, time_y), time_font, footer_config_with_theme)
-        
+                lines.append(time_line)
+
+        self._render_text_block(img, draw, lines, spec.position, spec.config)
+
         return img
     
-    def render_custom_elements(self, img: Image.Image) -> Image.Image:
+    def render_custom_elements(self, img: Image.Image, draw=None) -> Image.Image:
         """
         Render custom text elements with individual styling.
-        
+
         Args:
             img: PIL Image object
-            
+            draw: Optional shared ImageDraw object for the image
+
         Returns:
             Image with custom elements added
         """
-        # Render custom footer elements
-        footer_elements = self.config.get("footer", {}).get("custom_elements", [])
-        for element in footer_elements:
-            img = self._render_custom_element(img, element)
-        
-        # Render custom header elements
-        header_elements = self.config.get("header", {}).get("custom_elements", [])
-        for element in header_elements:
-            img = self._render_custom_element(img, element)
-        
+        # Specs are pre-built in render order (footer, then header)
+        for spec in self._custom_specs:
+            img = self._render_custom_element(img, spec, draw)
+
         return img
-    
-    def _render_custom_element(self, img: Image.Image, element: Dict[str, Any]) -> Image.Image:
+
+    def _render_custom_element(self, img: Image.Image, spec: TextSpec,
+                              draw=None) -> Image.Image:
         """
         Render a single custom text element.
-        
+
         Args:
             img: PIL Image object
-            element: Element configuration dictionary
-            
+            spec: Pre-built spec for the element
+            draw: Optional shared ImageDraw object for the image
+
         Returns:
             Image with custom element added
         """
-        if not element.get("enabled", True):
-            return img
-        
         width, height = img.size
-        draw = ImageDraw.Draw(img)
-        
-        # Load font
-        font_family = element.get("font_family", "mono")
-        font_style = element.get("font_style", "normal")
-        font_size = element.get("size", 16)
-        font = self._load_font(font_family, font_size, font_style)
-        
-        # Get text and position
-        text = element.get("text", "Custom Text")
-        position = element.get("position", "center")
-        
-        # Calculate position
-        text_x, text_y = self._get_text_position(text, font, position, width, height)
-        
-        # Apply manual offset if specified
-        offset = element.get("offset", [0, 0])
-        text_x += offset[0]
-        text_y += offset[1]
-        
-        # Check bounds
-        text_x, text_y = self._check_text_bounds(text_x, text_y, text, font, width, height)
-        
+
+        # Reuse the caller's draw object when rendering a full pass
+        if draw is None:
+            draw = ImageDraw.Draw(img)
+
+        # Calculate position, apply the manual offset, then clamp
+        text_x, text_y = self._get_text_position(spec.text, spec.font, spec.position, width, height)
+        text_x += spec.offset[0]
+        text_y += spec.offset[1]
+        text_x, text_y = self._check_text_bounds(text_x, text_y, spec.text, spec.font, width, height)
+
         # Apply text effects
-        self._apply_text_effects(draw, text, (text_x, text_y), font, element)
-        
+        self._apply_text_effects(img, draw, spec.text, (text_x, text_y), spec.font, spec.config)
+
         return img
     
     def render_all_text(self, img: Image.Image) -> Image.Image:
@@ -586,9 +1232,45 @@ class TextRenderer:
         Returns:
             Image with all text elements added
         """
+        # Nothing enabled means nothing to draw - skip even the Draw
+        # allocation on the fast path
+        if not (self._header_enabled or self._footer_enabled or self._has_custom):
+            return img
+
+        # One mode check per pass: convert to RGBA only when some element
+        # will blend a translucent background
+        if self._needs_alpha and img.mode != "RGBA":
+            img = img.convert("RGBA")
+
+        # One draw object is shared by the whole pass; every renderer
+        # draws onto the same image so there is no need to reallocate it
+        draw = ImageDraw.Draw(img)
+
         # Render in order: header -> custom elements -> footer
-        img = self.render_header(img)
-        img = self.render_custom_elements(img)
-        img = self.render_footer(img)
-        
-        return img
\ No newline at end of file
+        img = self.render_header(img, draw)
+        img = self.render_custom_elements(img, draw)
+        img = self.render_footer(img, draw)
+
+        return img
+
+def render_batch(renderer: TextRenderer, images: List[Image.Image]) -> List[Image.Image]:
+    """
+    Render text onto multiple images in parallel across CPU cores.
+
+    TextRenderer state is read-only after __init__ (mappings are class
+    attributes and all caches are append-only), so one renderer can be
+    shared safely between threads - and PIL releases the GIL inside its
+    C-level draw operations, letting the pool scale with cores.
+
+    Args:
+        renderer: Configured TextRenderer instance
+        images: List of PIL Image objects to render onto
+
+    Returns:
+        List of rendered images in the same order
+    """
+    if len(images) <= 1:
+        return [renderer.render_all_text(img) for img in images]
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(pool.map(renderer.render_all_text, images))